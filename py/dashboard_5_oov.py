@@ -1,6 +1,14 @@
+import contextlib
+import os
+import uuid
+
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import plotly.express as px
+import plotly.graph_objects as go
 
 # ---- Constants and Config ----
 PARTY_COLORS = {
@@ -12,6 +20,25 @@ PARTY_COLORS = {
     'rep': '#FF0000'
 }
 
+PARTY_ALIASES = {
+    'Democratic': 'Democrat',
+    'dem': 'Democrat',
+    'rep': 'Republican'
+}
+
+# Only the columns the dashboard reads are loaded
+DOMAIN_COLS = ["Domain", "Score", "Global_Classification", "Sentiment", "Local_Category", "Topic_Category",
+               "Combination_Total_Count"]
+POSTS_COLS = ["Score", "party", "Sentiment_Category", "Local_Category", "Topic_Category", "ave_sentiment"]
+NUMERIC_DTYPES = {"Score": "float32", "Combination_Total_Count": "int32"}
+
+DOMAIN_CATEGORY_COLS = ["Global_Classification", "Sentiment", "Local_Category", "Topic_Category", "Domain"]
+POSTS_CATEGORY_COLS = ["party", "Sentiment_Category", "Local_Category", "Topic_Category"]
+MAX_SCATTER_POINTS = 20000
+SUNBURST_PATH = ['Topic_Category', 'Local_Category', 'Sentiment_Category', 'party']
+# Filter-keyed caches are shared by every session, so keep only the most recent states
+FILTER_CACHE_ENTRIES = 64
+
 # ---- Page Configuration ----
 st.set_page_config(
     page_title="News Analysis Dashboard",
@@ -19,55 +46,156 @@ st.set_page_config(
 )
 
 # ---- Data Loading Functions ----
+def read_cached_csv(csv_path, usecols):
+    """Read columns of a CSV through a Parquet sidecar, rebuilt when the CSV is newer or columns are missing."""
+    dtype = {col: NUMERIC_DTYPES[col] for col in usecols if col in NUMERIC_DTYPES}
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        try:
+            # Sidecars only hold the columns loaded when they were written
+            if set(usecols) <= set(pq.read_schema(parquet_path).names):
+                df = pd.read_parquet(parquet_path, engine="pyarrow", columns=usecols, dtype_backend="pyarrow")
+                # Also narrows sidecars written before the current dtypes
+                return df.astype(dtype)
+        except (OSError, pa.ArrowException):
+            # Corrupt or unreadable sidecars are rebuilt from the CSV below, like stale ones
+            pass
+
+    # read_csv's dtype= is not reliably honoured with the pyarrow backend (ints come back float64),
+    # so narrow explicitly before the sidecar is written and match the sidecar's column order
+    df = pd.read_csv(csv_path, usecols=usecols, dtype_backend="pyarrow")[usecols].astype(dtype)
+
+    # Write to a uniquely named temp file and swap it in, so an interrupted write never leaves a
+    # truncated sidecar. to_parquet creates it with the normal umask-derived mode (mkstemp would
+    # force 0600), keeping the sidecar readable by other accounts. If the directory isn't
+    # writable, the parsed CSV is still returned.
+    tmp_path = f"{parquet_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+    return df
+
+@st.cache_data
+def load_domain_data():
+    """Load and preprocess the domain analysis data."""
+    domain_df = read_cached_csv(r"csv/analysis_results/all_analysis_data.csv", DOMAIN_COLS)
+
+    # Collapse party spelling variants before categorizing
+    domain_df["Global_Classification"] = domain_df["Global_Classification"].replace(PARTY_ALIASES)
+
+    # Low-cardinality strings are filtered and grouped constantly, so store them as codes
+    for col in DOMAIN_CATEGORY_COLS:
+        domain_df[col] = domain_df[col].astype("category")
+
+    return domain_df
+
 @st.cache_data
-def load_data():
-    """Load and preprocess all required data."""
-    domain_df = pd.read_csv(r"csv/analysis_results/all_analysis_data.csv")
-    posts_df = pd.read_csv(r"csv/analysis_results/scatter_analysis.csv")
-    return domain_df, posts_df
+def load_posts_data():
+    """Load and preprocess the posts analysis data."""
+    posts_df = read_cached_csv(r"csv/analysis_results/scatter_analysis.csv", POSTS_COLS)
+
+    # Collapse party spelling variants before categorizing
+    posts_df["party"] = posts_df["party"].replace(PARTY_ALIASES)
+
+    # Low-cardinality strings are filtered and grouped constantly, so store them as codes
+    for col in POSTS_CATEGORY_COLS:
+        posts_df[col] = posts_df[col].astype("category")
+
+    return posts_df
+
+def category_mask(series, value):
+    """Boolean mask of rows in a categorical series equal to value, compared on codes."""
+    codes = series.cat.codes.to_numpy()
+    if value not in series.cat.categories:
+        return np.zeros(len(codes), dtype=bool)
+    return codes == series.cat.categories.get_loc(value)
+
+def score_bounds(df):
+    """Return the lowest and highest score in dataframe, ignoring missing scores."""
+    scores = df["Score"].to_numpy(dtype="float64", na_value=np.nan)
+    return float(np.nanmin(scores)), float(np.nanmax(scores))
+
+def score_mask(df, score_range):
+    """Boolean mask of rows whose score lies inside score_range."""
+    scores = df["Score"].to_numpy(dtype="float64", na_value=np.nan)
+    return (scores >= score_range[0]) & (scores <= score_range[1])
 
 def filter_dataframe(df, filters):
     """Apply filters to dataframe."""
-    filtered_df = df.copy()
-
-    # Score range filter
-    filtered_df = filtered_df[
-        (filtered_df["Score"] >= filters["score_range"][0]) &
-        (filtered_df["Score"] <= filters["score_range"][1])
+    masks = [
+        score_mask(df, filters["score_range"]),
+        # Unfiltered local category means the pre-aggregated "all" rows
+        category_mask(df["Local_Category"], filters["local_cat"] if filters["local_cat"] != "All" else "all")
     ]
 
     # Categorical filters
     if filters["party"] != "All":
-        filtered_df = filtered_df[filtered_df["Global_Classification"] == filters["party"]]
+        masks.append(category_mask(df["Global_Classification"], filters["party"]))
     if filters["sentiment"] != "All":
-        filtered_df = filtered_df[filtered_df["Sentiment"] == filters["sentiment"]]
+        masks.append(category_mask(df["Sentiment"], filters["sentiment"]))
+    if filters["topic"] != "All":
+        masks.append(category_mask(df["Topic_Category"], filters["topic"]))
+
+    return df.loc[np.logical_and.reduce(masks)]
+
+def default_filters(full_score_range):
+    """Filter values the sidebar starts with."""
+    return {"score_range": full_score_range, "party": "All", "sentiment": "All", "local_cat": "All", "topic": "All"}
+
+def is_default_filters(filters, full_score_range):
+    """Check whether the sidebar filters are still at their initial values."""
+    return filters == default_filters(full_score_range)
+
+def search_domains(df, search_text, exact_domain):
+    """Apply the domain search box and exact-domain selection to dataframe."""
+    if search_text:
+        # Match the literal text against each distinct domain once, then map back through the codes;
+        # the trailing False catches the -1 code of missing domains
+        domains = df["Domain"]
+        hits = np.asarray(domains.cat.categories.str.contains(search_text, case=False, regex=False), dtype=bool)
+        df = df[np.append(hits, False)[domains.cat.codes.to_numpy()]]
+    if exact_domain:
+        df = df[category_mask(df["Domain"], exact_domain)]
+    return df
+
+def filter_posts(df, filters):
+    """Apply filters to posts dataframe."""
+    masks = [score_mask(df, filters["score_range"])]
+
+    if filters["party"] != "All":
+        masks.append(category_mask(df["party"], filters["party"]))
+    if filters["sentiment"] != "All":
+        masks.append(category_mask(df["Sentiment_Category"], filters["sentiment"]))
     if filters["local_cat"] != "All":
-        filtered_df = filtered_df[filtered_df["Local_Category"] == filters["local_cat"]]
-    else:
-        filtered_df = filtered_df[filtered_df["Local_Category"] == "all"]
+        masks.append(category_mask(df["Local_Category"], filters["local_cat"]))
     if filters["topic"] != "All":
-        filtered_df = filtered_df[filtered_df["Topic_Category"] == filters["topic"]]
+        masks.append(category_mask(df["Topic_Category"], filters["topic"]))
 
-    return filtered_df
+    return df.loc[np.logical_and.reduce(masks)]
 
 # ---- Visualization Functions ----
 def create_party_distribution_chart(data, x_col, y_col="Combination_Total_Count", title=""):
     """Create a bar chart showing distribution by party."""
-    fig = px.bar(
-        data,
-        x=x_col,
-        y=y_col,
-        color="Global_Classification",
-        color_discrete_map=PARTY_COLORS,
+    fig = go.Figure([
+        go.Bar(
+            x=party_data[x_col].astype(str),
+            y=party_data[y_col],
+            name=party,
+            marker_color=PARTY_COLORS.get(party)
+        )
+        for party, party_data in data.groupby("Global_Classification", observed=True, sort=False)
+    ])
+    fig.update_layout(
         barmode="group",
         title=title,
-        labels={
-            x_col: x_col.replace("_", " "),
-            y_col: "Number of Articles",
-            "Global_Classification": "Party"
-        }
+        xaxis_title=x_col.replace("_", " "),
+        yaxis_title="Number of Articles",
+        legend_title_text="Party",
+        xaxis_tickangle=45
     )
-    fig.update_layout(xaxis_tickangle=45)
     return fig
 
 def create_score_distribution_chart(data, title=""):
@@ -78,7 +206,7 @@ def create_score_distribution_chart(data, title=""):
         y="Score",
         color="Global_Classification",
         color_discrete_map=PARTY_COLORS,
-        points="all",
+        points="outliers",
         title=title,
         labels={
             "Global_Classification": "Party",
@@ -87,31 +215,196 @@ def create_score_distribution_chart(data, title=""):
     )
     return fig
 
+def create_sentiment_score_chart(posts):
+    """Create a scatter plot of post sentiment against score."""
+    # Cap the points sent to the browser and draw them with WebGL
+    if len(posts) > MAX_SCATTER_POINTS:
+        posts = posts.sample(MAX_SCATTER_POINTS, random_state=0)
+
+    fig = go.Figure([
+        go.Scattergl(
+            x=party_posts["ave_sentiment"],
+            y=party_posts["Score"],
+            mode="markers",
+            name=party,
+            marker_color=PARTY_COLORS.get(party),
+            customdata=np.column_stack([
+                party_posts["Local_Category"].astype(str),
+                party_posts["Topic_Category"].astype(str)
+            ]),
+            hovertemplate=(
+                f"party={party}<br>ave_sentiment=%{{x}}<br>Score=%{{y}}<br>"
+                "Local_Category=%{customdata[0]}<br>Topic_Category=%{customdata[1]}<extra></extra>"
+            )
+        )
+        for party, party_posts in posts.groupby("party", observed=True, sort=False)
+    ])
+    fig.update_layout(xaxis_title="ave_sentiment", yaxis_title="Score", legend_title_text="party")
+    return fig
+
+def create_topic_distribution_chart(posts):
+    """Create a grouped bar chart of post counts per topic and party."""
+    # Count in pandas so only one bar per topic/party reaches the browser
+    topic_counts = posts.groupby(["Topic_Category", "party"], observed=True).size().reset_index(name="count")
+    fig = go.Figure([
+        go.Bar(
+            x=party_counts["Topic_Category"].astype(str),
+            y=party_counts["count"],
+            name=party,
+            marker_color=PARTY_COLORS.get(party)
+        )
+        for party, party_counts in topic_counts.groupby("party", observed=True)
+    ])
+    fig.update_layout(
+        barmode="group",
+        xaxis_title="Topic_Category",
+        yaxis_title="count",
+        legend_title_text="party",
+        xaxis_tickangle=45
+    )
+    return fig
+
+def create_party_share_chart(posts):
+    """Create a pie chart of post counts per party."""
+    party_counts = posts["party"].value_counts()
+    party_counts = party_counts[party_counts > 0]
+    labels = party_counts.index.astype(str).tolist()
+    return go.Figure(go.Pie(
+        labels=labels,
+        values=party_counts.to_numpy(),
+        marker_colors=[PARTY_COLORS.get(party) for party in labels]
+    ))
+
 def calculate_domain_statistics(df):
     """Calculate domain statistics."""
-    stats_df = df.groupby("Domain").agg({
-        "Combination_Total_Count": "sum",
-        "Score": ["mean", "min", "max"],
-        "Global_Classification": "first"
-    }).round(2)
-
-    stats_df.columns = ["Total Articles", "Average Score", "Min Score", "Max Score", "Party"]
-    stats_df = stats_df.reset_index().sort_values("Total Articles", ascending=False)
+    stats_df = df.groupby("Domain", observed=True, sort=False).agg(
+        **{
+            "Total Articles": ("Combination_Total_Count", "sum"),
+            "Average Score": ("Score", "mean"),
+            "Min Score": ("Score", "min"),
+            "Max Score": ("Score", "max"),
+            "Party": ("Global_Classification", "first")
+        }
+    )
+    # Widen the float32 scores before rounding so the table shows clean decimals
+    score_cols = ["Average Score", "Min Score", "Max Score"]
+    stats_df[score_cols] = stats_df[score_cols].astype("float64").round(2)
 
-    # Calculate party-specific counts
-    dem_counts = df[df["Global_Classification"].isin(["Democrat", "Democratic", "dem"])].groupby("Domain")[
-        "Combination_Total_Count"].sum()
-    rep_counts = df[df["Global_Classification"].isin(["Republican", "rep"])].groupby("Domain")[
-        "Combination_Total_Count"].sum()
+    # Calculate party-specific counts in one pass; aliases are already collapsed at load time
+    party_counts = df.groupby(["Domain", "Global_Classification"], observed=True, sort=False)[
+        "Combination_Total_Count"].sum().unstack(fill_value=0)
+    party_counts = party_counts.reindex(columns=["Democrat", "Republican"], fill_value=0).astype(int)
+    party_counts.columns = ["Democrat Articles", "Republican Articles"]
 
-    # Add party-specific counts
-    stats_df["Democrat Articles"] = stats_df["Domain"].map(dem_counts).fillna(0).astype(int)
-    stats_df["Republican Articles"] = stats_df["Domain"].map(rep_counts).fillna(0).astype(int)
+    stats_df = stats_df.join(party_counts).reset_index().sort_values("Total Articles", ascending=False)
 
     # Reorder columns
     return stats_df[["Domain", "Total Articles", "Democrat Articles", "Republican Articles",
                      "Average Score", "Min Score", "Max Score", "Party"]]
 
+def calculate_sunburst_data(filtered_posts, total_count_all):
+    """Count posts per sunburst path and build their hover labels."""
+    total_count_filtered = filtered_posts.shape[0]
+
+    sunburst_data = filtered_posts.value_counts(SUNBURST_PATH, sort=False).reset_index(name='count')
+    # Categorical keys can still yield empty combinations, which the sunburst can't draw
+    sunburst_data = sunburst_data[sunburst_data['count'] > 0].reset_index(drop=True)
+    # px.sunburst aggregates the path columns itself and can't do that on categoricals
+    sunburst_data[SUNBURST_PATH] = sunburst_data[SUNBURST_PATH].astype(str)
+
+    # Add percentage columns - both for total and filtered data
+    counts = sunburst_data['count'].to_numpy()
+    pct_total = np.round(counts / total_count_all * 100, 1)
+    pct_filtered = np.round(counts / total_count_filtered * 100, 1)
+    sunburst_data['percentage_total'] = pct_total
+    sunburst_data['percentage_filtered'] = pct_filtered
+    sunburst_data['label'] = [
+        f"{count}<br>({filtered}% of filtered data<br>{total}% of total data)"
+        for count, filtered, total in zip(counts, pct_filtered, pct_total)
+    ]
+    return sunburst_data
+
+def calculate_party_statistics(filtered_posts):
+    """Calculate per-party summary statistics for posts."""
+    party_stats = filtered_posts.groupby("party", observed=True).agg({
+        "Score": ["count", "mean"],
+        "ave_sentiment": "mean"
+    })
+    party_stats.columns = ["Total Articles", "Average Score", "Average Sentiment"]
+    party_stats = party_stats.astype({"Average Score": "float64"}).round(2)
+    return party_stats
+
+# ---- Cached Views and Aggregations ----
+# Most visits never touch the sidebar, so the default-filter views are built
+# once per process and shared as-is instead of re-masking the frame every rerun.
+@st.cache_resource(show_spinner=False)
+def default_domain_view(_domain_df, full_score_range):
+    """Domain rows shown while every filter is at its default."""
+    return filter_dataframe(_domain_df, default_filters(full_score_range))
+
+@st.cache_resource(show_spinner=False)
+def default_posts_view(_posts_df, full_score_range):
+    """Posts shown while every filter is at its default."""
+    return filter_posts(_posts_df, default_filters(full_score_range))
+
+# The base frames come from the load_*_data() loaders and never change, so they are passed
+# unhashed (leading underscore) and results are keyed on the filter values only.
+@st.cache_data(show_spinner=False)
+def domain_filter_options(_domain_df):
+    """Slider bounds and selectbox choices for the domain analysis filters."""
+    return {
+        "score_bounds": score_bounds(_domain_df),
+        "parties": _domain_df["Global_Classification"].unique().tolist(),
+        "sentiments": _domain_df["Sentiment"].unique().tolist(),
+        "topics": _domain_df["Topic_Category"].unique().tolist()
+    }
+
+@st.cache_data(show_spinner=False)
+def posts_filter_options(_posts_df):
+    """Slider bounds and selectbox choices for the posts analysis filters."""
+    return {
+        "score_bounds": score_bounds(_posts_df),
+        "parties": _posts_df["party"].unique().tolist(),
+        "sentiments": _posts_df["Sentiment_Category"].unique().tolist(),
+        "local_cats": sorted(_posts_df["Local_Category"].dropna().unique().tolist()),
+        "topics": _posts_df["Topic_Category"].unique().tolist()
+    }
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def domain_choices(_domain_df, filters_key):
+    """Sorted domains left after filtering, for the exact-domain selectbox."""
+    filtered_df = filter_dataframe(_domain_df, dict(filters_key))
+    # Categories are kept sorted, so dropping the unused ones needs no Python sort
+    return filtered_df["Domain"].cat.remove_unused_categories().cat.categories.tolist()
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def cached_domain_statistics(_domain_df, filters_key, search_text="", exact_domain=""):
+    """Filter the base domain dataframe and calculate its domain statistics."""
+    filtered_df = filter_dataframe(_domain_df, dict(filters_key))
+    return calculate_domain_statistics(search_domains(filtered_df, search_text, exact_domain))
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def domain_statistics_table(_domain_df, filters_key, search_text="", exact_domain=""):
+    """Convert the domain statistics to an Arrow table for st.dataframe."""
+    stats_df = cached_domain_statistics(_domain_df, filters_key, search_text, exact_domain)
+    return pa.Table.from_pandas(stats_df, preserve_index=False)
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def domain_statistics_csv(_domain_df, filters_key, search_text="", exact_domain=""):
+    """Encode the domain statistics for the download button."""
+    stats_df = cached_domain_statistics(_domain_df, filters_key, search_text, exact_domain)
+    return stats_df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def cached_sunburst_data(_posts_df, filters_key):
+    """Filter the base posts dataframe and calculate its sunburst data."""
+    return calculate_sunburst_data(filter_posts(_posts_df, dict(filters_key)), _posts_df.shape[0])
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def cached_party_statistics(_posts_df, filters_key):
+    """Filter the base posts dataframe and calculate its party statistics."""
+    return calculate_party_statistics(filter_posts(_posts_df, dict(filters_key)))
+
 def show_debug_info(df):
     """Show debug information in sidebar."""
     st.sidebar.markdown("---")
@@ -125,27 +418,66 @@ def show_debug_info(df):
             df[["Domain", "Global_Classification", "Combination_Total_Count"]].head()
         )
 
+@st.fragment
+def show_domain_search(df, filters_key):
+    """Show domain search and statistics; search edits rerun only this fragment."""
+    st.markdown("---")
+    st.subheader("Domain Search")
+    col_search1, col_search2 = st.columns([1, 1])
+
+    with col_search1:
+        search_text = st.text_input(
+            "Search domains by text",
+            help="Enter any part of the domain name"
+        )
+
+    with col_search2:
+        all_domains = domain_choices(df, filters_key)
+        exact_domain = st.selectbox(
+            "Or select exact domain",
+            [""] + all_domains,
+            help="Select a specific domain from the list"
+        )
+
+    # Domain Statistics
+    st.header("Detailed Domain Statistics")
+    st.dataframe(
+        domain_statistics_table(df, filters_key, search_text, exact_domain),
+        use_container_width=True,
+        height=400
+    )
+
+    # Download button
+    st.download_button(
+        label="Download Domain Statistics",
+        data=domain_statistics_csv(df, filters_key, search_text, exact_domain),
+        file_name='domain_statistics.csv',
+        mime='text/csv'
+    )
+
 def run_domain_analysis(df):
     """Run the domain analysis section."""
     st.title("Domain Level Analysis")
+    options = domain_filter_options(df)
+    full_score_range = options["score_bounds"]
 
     # Sidebar filters
     st.sidebar.header("Filters")
     filters = {
         "score_range": st.sidebar.slider(
             "Score Range",
-            min_value=float(df["Score"].min()),
-            max_value=float(df["Score"].max()),
-            value=(float(df["Score"].min()), float(df["Score"].max())),
+            min_value=full_score_range[0],
+            max_value=full_score_range[1],
+            value=full_score_range,
             step=0.1
         ),
         "party": st.sidebar.selectbox(
             "Party",
-            ["All"] + list(df["Global_Classification"].unique())
+            ["All"] + options["parties"]
         ),
         "sentiment": st.sidebar.selectbox(
             "Sentiment",
-            ["All"] + list(df["Sentiment"].unique())
+            ["All"] + options["sentiments"]
         ),
         "local_cat": st.sidebar.selectbox(
             "Local Category",
@@ -153,12 +485,16 @@ def run_domain_analysis(df):
         ),
         "topic": st.sidebar.selectbox(
             "Topic",
-            ["All"] + list(df["Topic_Category"].unique())
+            ["All"] + options["topics"]
         )
     }
 
     # Apply filters
-    filtered_df = filter_dataframe(df, filters)
+    if is_default_filters(filters, full_score_range):
+        filtered_df = default_domain_view(df, full_score_range)
+    else:
+        filtered_df = filter_dataframe(df, filters)
+    filters_key = tuple(filters.items())
 
     # Domain Deep Dive Section
     st.header("Domain Deep Dive")
@@ -167,7 +503,7 @@ def run_domain_analysis(df):
     col1, col2 = st.columns(2)
 
     with col1:
-        topic_dist = filtered_df.groupby(["Topic_Category", "Global_Classification"])[
+        topic_dist = filtered_df.groupby(["Topic_Category", "Global_Classification"], observed=True)[
             "Combination_Total_Count"].sum().reset_index()
         fig = create_party_distribution_chart(
             topic_dist,
@@ -177,7 +513,7 @@ def run_domain_analysis(df):
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
-        sentiment_dist = filtered_df.groupby(["Sentiment", "Global_Classification"])[
+        sentiment_dist = filtered_df.groupby(["Sentiment", "Global_Classification"], observed=True)[
             "Combination_Total_Count"].sum().reset_index()
         fig = create_party_distribution_chart(
             sentiment_dist,
@@ -197,7 +533,8 @@ def run_domain_analysis(df):
         st.plotly_chart(fig, use_container_width=True)
 
     with col4:
-        topic_score = filtered_df.groupby(["Topic_Category", "Global_Classification"])["Score"].mean().reset_index()
+        topic_score = filtered_df.groupby(["Topic_Category", "Global_Classification"], observed=True)[
+            "Score"].mean().reset_index()
         fig = create_party_distribution_chart(
             topic_score,
             "Topic_Category",
@@ -207,47 +544,7 @@ def run_domain_analysis(df):
         st.plotly_chart(fig, use_container_width=True)
 
     # Domain Search and Statistics
-    st.markdown("---")
-    st.subheader("Domain Search")
-    col_search1, col_search2 = st.columns([1, 1])
-
-    with col_search1:
-        search_text = st.text_input(
-            "Search domains by text",
-            help="Enter any part of the domain name"
-        )
-
-    with col_search2:
-        all_domains = sorted(filtered_df["Domain"].unique())
-        exact_domain = st.selectbox(
-            "Or select exact domain",
-            [""] + all_domains,
-            help="Select a specific domain from the list"
-        )
-
-    # Apply domain filters
-    if search_text:
-        filtered_df = filtered_df[filtered_df["Domain"].str.contains(search_text, case=False)]
-    if exact_domain:
-        filtered_df = filtered_df[filtered_df["Domain"] == exact_domain]
-
-    # Domain Statistics
-    st.header("Detailed Domain Statistics")
-    stats_df = calculate_domain_statistics(filtered_df)
-
-    st.dataframe(
-        stats_df,
-        use_container_width=True,
-        height=400
-    )
-
-    # Download button
-    st.download_button(
-        label="Download Domain Statistics",
-        data=stats_df.to_csv(index=False).encode('utf-8'),
-        file_name='domain_statistics.csv',
-        mime='text/csv'
-    )
+    show_domain_search(df, filters_key)
 
     # Debug information
     show_debug_info(filtered_df)
@@ -255,49 +552,43 @@ def run_domain_analysis(df):
 def run_posts_analysis(posts_df):
     """Run the posts analysis section of the dashboard."""
     st.title("Articles Analysis")
+    options = posts_filter_options(posts_df)
+    full_score_range = options["score_bounds"]
 
     # Sidebar filters
     st.sidebar.header("Filters")
     filters = {
         "score_range": st.sidebar.slider(
             "Score Range",
-            min_value=float(posts_df["Score"].min()),
-            max_value=float(posts_df["Score"].max()),
-            value=(float(posts_df["Score"].min()), float(posts_df["Score"].max())),
+            min_value=full_score_range[0],
+            max_value=full_score_range[1],
+            value=full_score_range,
             step=0.1
         ),
         "party": st.sidebar.selectbox(
             "Party",
-            ["All"] + list(posts_df["party"].unique())
+            ["All"] + options["parties"]
         ),
         "sentiment": st.sidebar.selectbox(
             "Sentiment Category",
-            ["All"] + list(posts_df["Sentiment_Category"].unique())
+            ["All"] + options["sentiments"]
         ),
         "local_cat": st.sidebar.selectbox(
             "Local Category",
-            ["All"] + sorted(list(posts_df["Local_Category"].dropna().unique()))
+            ["All"] + options["local_cats"]
         ),
         "topic": st.sidebar.selectbox(
             "Topic Category",
-            ["All"] + list(posts_df["Topic_Category"].unique())
+            ["All"] + options["topics"]
         )
     }
 
     # Apply filters
-    filtered_posts = posts_df[
-        (posts_df["Score"] >= filters["score_range"][0]) &
-        (posts_df["Score"] <= filters["score_range"][1])
-    ]
-
-    if filters["party"] != "All":
-        filtered_posts = filtered_posts[filtered_posts["party"] == filters["party"]]
-    if filters["sentiment"] != "All":
-        filtered_posts = filtered_posts[filtered_posts["Sentiment_Category"] == filters["sentiment"]]
-    if filters["local_cat"] != "All":
-        filtered_posts = filtered_posts[filtered_posts["Local_Category"] == filters["local_cat"]]
-    if filters["topic"] != "All":
-        filtered_posts = filtered_posts[filtered_posts["Topic_Category"] == filters["topic"]]
+    if is_default_filters(filters, full_score_range):
+        filtered_posts = default_posts_view(posts_df, full_score_range)
+    else:
+        filtered_posts = filter_posts(posts_df, filters)
+    filters_key = tuple(filters.items())
 
     st.subheader("Content Distribution Sunburst")
     st.caption("Hierarchical view of content distribution across different categories")
@@ -306,22 +597,11 @@ def run_posts_analysis(posts_df):
     total_count_all = posts_df.shape[0]  # Total data in system
     total_count_filtered = filtered_posts.shape[0]  # Total filtered data
 
-    sunburst_data = filtered_posts.groupby(
-        ['Topic_Category', 'Local_Category', 'Sentiment_Category', 'party']
-    ).size().reset_index(name='count')
-
-    # Add percentage columns - both for total and filtered data
-    sunburst_data['percentage_total'] = (sunburst_data['count'] / total_count_all * 100).round(1)
-    sunburst_data['percentage_filtered'] = (sunburst_data['count'] / total_count_filtered * 100).round(1)
-    sunburst_data['label'] = (
-            sunburst_data['count'].astype(str) +
-            '<br>(' + sunburst_data['percentage_filtered'].astype(str) + '% of filtered data' +
-            '<br>' + sunburst_data['percentage_total'].astype(str) + '% of total data)'
-    )
+    sunburst_data = cached_sunburst_data(posts_df, filters_key)
 
     fig = px.sunburst(
         sunburst_data,
-        path=['Topic_Category', 'Local_Category', 'Sentiment_Category', 'party'],
+        path=SUNBURST_PATH,
         values='count',
         title='Content Distribution Hierarchy',
         color='party',
@@ -357,46 +637,23 @@ def run_posts_analysis(posts_df):
     with col1:
         # Sentiment vs Score scatter
         st.subheader("Sentiment vs Score")
-        fig = px.scatter(
-            filtered_posts,
-            x="ave_sentiment",
-            y="Score",
-            color="party",
-            color_discrete_map=PARTY_COLORS,
-            hover_data=["Local_Category", "Topic_Category"]
-        )
+        fig = create_sentiment_score_chart(filtered_posts)
         st.plotly_chart(fig, use_container_width=True)
 
         # Party distribution pie chart
         st.subheader("Party Distribution")
-        party_fig = px.pie(
-            filtered_posts,
-            names="party",
-            color="party",
-            color_discrete_map=PARTY_COLORS
-        )
+        party_fig = create_party_share_chart(filtered_posts)
         st.plotly_chart(party_fig, use_container_width=True)
 
     with col2:
         # Topic distribution by party
         st.subheader("Topic Distribution by Party")
-        topic_fig = px.histogram(
-            filtered_posts,
-            x="Topic_Category",
-            color="party",
-            barmode="group",
-            color_discrete_map=PARTY_COLORS
-        )
-        topic_fig.update_layout(xaxis_tickangle=45)
+        topic_fig = create_topic_distribution_chart(filtered_posts)
         st.plotly_chart(topic_fig, use_container_width=True)
 
         # Summary statistics by party
         st.subheader("Summary Statistics by Party")
-        party_stats = filtered_posts.groupby("party").agg({
-            "Score": ["count", "mean"],
-            "ave_sentiment": "mean"
-        }).round(2)
-        party_stats.columns = ["Total Articles", "Average Score", "Average Sentiment"]
+        party_stats = cached_party_statistics(posts_df, filters_key)
         st.dataframe(party_stats, use_container_width=True)
 
     # Debug information
@@ -406,17 +663,15 @@ def run_posts_analysis(posts_df):
 # ---- Main Dashboard Function ----
 def run_dashboard():
     """Main function to run the dashboard."""
-    # Load data
-    domain_df, posts_df = load_data()
-
     # Sidebar navigation
     st.sidebar.title("Navigation")
     page = st.sidebar.radio("Select Analysis Type", ["Domain Analysis", "Articles Analysis"])
 
+    # Load only the data the selected page needs
     if page == "Domain Analysis":
-        run_domain_analysis(domain_df)
+        run_domain_analysis(load_domain_data())
     else:
-        run_posts_analysis(posts_df)
+        run_posts_analysis(load_posts_data())
 
 # ---- Run Dashboard ----
 if __name__ == "__main__":